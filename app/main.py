@@ -1,18 +1,55 @@
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from functools import lru_cache
+from itertools import compress
 import random
-import uuid
-from typing import Any, Dict, List, Optional
+import secrets
+from typing import Any, Dict, List, Optional, Tuple
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
+import orjson
 from pydantic import BaseModel
 
 
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC
+
+
+# orjson handles datetime and UUID natively; this only covers what it lacks.
+def orjson_default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dump_json(content: Any) -> bytes:
+    return orjson.dumps(content, default=orjson_default, option=ORJSON_OPTIONS)
+
+
+class FastORJSONResponse(ORJSONResponse):
+    def render(self, content: Any) -> bytes:
+        return dump_json(content)
+
+
+class PydanticResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content: BaseModel) -> bytes:
+        return content.model_dump_json().encode()
+
+
 app = FastAPI(
     title="RQ Mobile API",
     version="2.0.0",
     description="Backend API for RQ Mobile iOS app",
+    default_response_class=FastORJSONResponse,
 )
 
+# Search, notification and property detail payloads are large and repetitive
+# JSON; small responses stay uncompressed.
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 
 # ---------------------------------------------------------------------------
 # Mock data (can be replaced later with a real database)
@@ -43,28 +80,60 @@ MOCK_USERS: Dict[str, Dict[str, Any]] = {
 
 MOCK_PROPERTIES: List[Dict[str, Any]] = []
 
+# Room counts and their whole-room value used in listing titles.
+ROOM_INT: Dict[float, int] = {1.5: 1, 2: 2, 2.5: 2, 3: 3, 3.5: 3, 4: 4, 5: 5}
 
-def generate_mock_properties() -> None:
-    cities = ["תל אביב", "ירושלים", "חיפה", "ראשון לציון", "נתניה"]
-    streets = ["הרצל", "דיזנגוף", "אלנבי", "בוגרשוב", "שבזי"]
-    property_types = ["apartment", "penthouse", "house"]
-    features = ["mamad", "elevator", "parking", "storage", "balcony", "renovated"]
 
-    for i in range(1, 51):
-        city = random.choice(cities)
-        price = random.randint(1_000_000, 6_000_000)
-        size = random.randint(50, 150)
-        rooms = random.choice([1.5, 2, 2.5, 3, 3.5, 4, 5])
+def generate_mock_properties() -> None:
+    cities = ("תל אביב", "ירושלים", "חיפה", "ראשון לציון", "נתניה")
+    streets = ("הרצל", "דיזנגוף", "אלנבי", "בוגרשוב", "שבזי")
+    property_types = ("apartment", "penthouse", "house")
+    features = ("mamad", "elevator", "parking", "storage", "balcony", "renovated")
+    count = 50
+
+    # Draw each field for all properties in one call instead of per property.
+    draws = zip(
+        range(1, count + 1),
+        random.choices(cities, k=count),
+        random.choices(range(1_000_000, 6_000_001), k=count),
+        random.choices(range(50, 151), k=count),
+        random.choices(tuple(ROOM_INT), k=count),
+        random.choices(property_types, k=count),
+        random.choices(streets, k=count),
+        random.choices(range(1, 101), k=count),
+        random.choices(range(1, 11), k=count),
+        random.choices(range(1, 16), k=count),
+        random.choices(range(3, 21), k=count),
+        random.choices(range(40, 96), k=count),
+        random.choices(("השקעה מצוינת", "השקעה טובה", "הוגן"), k=count),
+        random.choices(range(0, 5), k=count),
+    )
 
+    for (
+        i,
+        city,
+        price,
+        size,
+        rooms,
+        property_type,
+        street,
+        number,
+        neighborhood,
+        floor,
+        total_floors,
+        rq_score,
+        rq_score_label,
+        feature_count,
+    ) in draws:
         prop: Dict[str, Any] = {
             "id": f"property-{i}",
-            "title": f"דירה {int(rooms)} חדרים ב{city}",
-            "propertyType": random.choice(property_types),
+            "title": f"דירה {ROOM_INT[rooms]} חדרים ב{city}",
+            "propertyType": property_type,
             "address": {
-                "street": random.choice(streets),
-                "number": str(random.randint(1, 100)),
+                "street": street,
+                "number": str(number),
                 "city": city,
-                "neighborhood": f"שכונת {random.randint(1, 10)}",
+                "neighborhood": f"שכונת {neighborhood}",
                 "latitude": 32.0 + random.random(),
                 "longitude": 34.0 + random.random(),
             },
@@ -72,19 +141,33 @@ def generate_mock_properties() -> None:
             "pricePerSqm": price // size,
             "rooms": rooms,
             "sizeSqm": size,
-            "floor": random.randint(1, 15),
-            "totalFloors": random.randint(3, 20),
-            "rqScore": random.randint(40, 95),
-            "rqScoreLabel": random.choice(["השקעה מצוינת", "השקעה טובה", "הוגן"]),
+            "floor": floor,
+            "totalFloors": total_floors,
+            "rqScore": rq_score,
+            "rqScoreLabel": rq_score_label,
             "primaryImageUrl": f"https://picsum.photos/400/300?random={i}",
             "lastUpdatedAt": "2025-01-15T10:30:00Z",
-            "features": random.sample(features, random.randint(0, 4)),
+            "features": random.sample(features, feature_count),
         }
         MOCK_PROPERTIES.append(prop)
 
 
 generate_mock_properties()
 
+# Lowercased title/city per property, built once so search does a single
+# substring check per item. The newline keeps matches from spanning fields.
+# Keys and properties are kept in parallel tuples so the scan only touches
+# strings and the matches are picked out with a boolean mask.
+SEARCH_KEYS: Tuple[str, ...] = tuple(f"{p['title']}\n{p['address']['city']}".lower() for p in MOCK_PROPERTIES)
+
+SEARCH_PROPERTIES: Tuple[Dict[str, Any], ...] = tuple(MOCK_PROPERTIES)
+
+PROPERTY_BY_ID: Dict[str, Dict[str, Any]] = {p["id"]: p for p in MOCK_PROPERTIES}
+
+PROPERTY_DESCRIPTIONS: Dict[str, str] = {
+    p["id"]: f"{p['title']}. דירה מרווחת ומוארת ב{p['address']['city']}." for p in MOCK_PROPERTIES
+}
+
 
 # ---------------------------------------------------------------------------
 # Schemas
@@ -118,26 +201,207 @@ class ReceiptVerifyRequest(BaseModel):
     productId: Optional[str] = None
 
 
+class UserModel(BaseModel):
+    id: str
+    firstName: str
+    lastName: str
+    email: str
+    phone: Optional[str] = None
+    subscriptionTier: str
+    preferredLocations: List[str]
+    createdAt: str
+
+
+class TokensResponse(BaseModel):
+    accessToken: str
+    refreshToken: str
+    expiresIn: int
+
+
+class AuthResponse(BaseModel):
+    user: UserModel
+    tokens: TokensResponse
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 
+# UTC timestamps use a trailing "Z" rather than isoformat()'s "+00:00" suffix.
+ISO_UTC_FORMAT = "%Y-%m-%dT%H:%M:%S.%fZ"
+
+
 def generate_tokens(user_id: str) -> Dict[str, Any]:
     return {
-        "accessToken": f"access-token-{user_id}-{uuid.uuid4().hex[:16]}",
-        "refreshToken": f"refresh-token-{user_id}-{uuid.uuid4().hex[:16]}",
+        "accessToken": f"access-token-{user_id}-{secrets.token_hex(8)}",
+        "refreshToken": f"refresh-token-{user_id}-{secrets.token_hex(8)}",
         "expiresIn": 3600,
     }
 
 
+def paginate_properties(properties: List[Dict[str, Any]], page: int, page_size: int) -> Dict[str, Any]:
+    start = (page - 1) * page_size
+    end = start + page_size
+    total_items = len(properties)
+
+    return {
+        "items": properties[start:end],
+        "meta": {
+            "page": page,
+            "pageSize": page_size,
+            # Ceiling division; an empty result has zero pages.
+            "totalPages": -(-total_items // page_size),
+            "totalItems": total_items,
+        },
+    }
+
+
+# Mock properties never change after startup, so every unfiltered search page
+# is serialized once here and served as raw bytes.
+SEARCH_PAGES: Dict[Tuple[int, int], bytes] = {
+    (page, page_size): dump_json(paginate_properties(MOCK_PROPERTIES, page, page_size))
+    for page_size in range(1, 51)
+    for page in range(1, -(-len(MOCK_PROPERTIES) // page_size) + 1)
+}
+
+# Shared body for endpoints that acknowledge with an empty object. A fresh
+# Response wraps it per request since FastAPI may attach background tasks
+# to the returned instance.
+EMPTY_RESPONSE = b"{}"
+
+PROFILE_RESPONSE = dump_json(MOCK_USERS["test@example.com"])
+
+# Subscription payloads only differ in their expiry, which is spliced into the
+# pre-serialized template per request.
+EXPIRES_AT_PLACEHOLDER = b"{expiresAt}"
+
+MOCK_SUBSCRIPTION = {"tier": "premium", "expiresAt": EXPIRES_AT_PLACEHOLDER.decode(), "autoRenewing": True}
+
+SUBSCRIPTION_TEMPLATE = dump_json(MOCK_SUBSCRIPTION)
+
+RECEIPT_VERIFIED_TEMPLATE = dump_json(
+    {"success": True, "subscription": MOCK_SUBSCRIPTION, "message": "Subscription activated"}
+)
+
+
+def render_subscription(template: bytes) -> Response:
+    expires_at = (datetime.now(timezone.utc) + timedelta(days=30)).strftime(ISO_UTC_FORMAT)
+    return Response(
+        content=template.replace(EXPIRES_AT_PLACEHOLDER, expires_at.encode()),
+        media_type="application/json",
+    )
+
+
+# Property details are deterministic per id, so each one is built and
+# serialized once and then served from the cache.
+@lru_cache(maxsize=128)
+def build_property_detail(property_id: str) -> bytes:
+    rng = random.Random(property_id)
+    full_property = PROPERTY_BY_ID[property_id].copy()
+    full_property.update(
+        {
+            "description": PROPERTY_DESCRIPTIONS[property_id],
+            "media": {
+                "images": [
+                    f"https://picsum.photos/600/400?random={property_id}-1",
+                    f"https://picsum.photos/600/400?random={property_id}-2",
+                    f"https://picsum.photos/600/400?random={property_id}-3",
+                ],
+                "videos": [],
+            },
+            "amenities": {
+                "mamad": rng.choice([True, False]),
+                "elevator": rng.choice([True, False]),
+                "parkingSpots": rng.randint(0, 2),
+                "storage": rng.choice([True, False]),
+                "balconySizeSqm": rng.randint(0, 20),
+                "renovated": rng.choice([True, False]),
+                "accessible": rng.choice([True, False]),
+                "ac": rng.choice([True, False]),
+            },
+            "prediction": {
+                "forecast12Months": int(full_property["price"] * 1.05),
+                "forecast24Months": int(full_property["price"] * 1.08),
+                "forecast60Months": int(full_property["price"] * 1.15),
+                "expectedIncreasePct": 5.0,
+                "annualRoiPct": 2.5,
+                "confidencePct": 80,
+            },
+            "neighborhood": {
+                "name": full_property["address"]["neighborhood"],
+                "avgPricePerSqm": full_property["price"] // full_property["sizeSqm"]
+                + rng.randint(-5_000, 5_000),
+                "avgRqScore": rng.randint(70, 85),
+                "propertiesCount": rng.randint(50, 200),
+                "amenities": {
+                    "schools": rng.randint(1, 5),
+                    "parks": rng.randint(1, 3),
+                    "transitLines": rng.randint(2, 8),
+                    "shoppingCenters": rng.randint(1, 4),
+                },
+            },
+            "reasons": [
+                {"label": "מיקום מרכזי", "sentiment": "positive"},
+                {"label": "מחיר תחרותי", "sentiment": "positive"},
+            ],
+        }
+    )
+
+    return dump_json(full_property)
+
+
+def build_notifications_page(page: int, page_size: int) -> Dict[str, Any]:
+    now = datetime.now(timezone.utc)
+    notifications: List[Dict[str, Any]] = []
+    for i in range(page_size):
+        notifications.append(
+            {
+                "id": f"notif-{i}",
+                "type": random.choice(["new_property", "price_drop", "rq_change"]),
+                "title": "עדכון חדש",
+                "body": "המחיר של נכס שמור ירד ב-2%",
+                "createdAt": (now - timedelta(hours=i)).strftime(ISO_UTC_FORMAT),
+                "readAt": None,
+                "propertyId": f"property-{random.randint(1, 50)}",
+                "savedSearchId": None,
+                "metadata": {
+                    "thumbnailUrl": "https://picsum.photos/100/100?random=1",
+                    "city": "תל אביב",
+                    "rqScore": random.randint(60, 90),
+                    "price": random.randint(1_500_000, 4_000_000),
+                    "changePercent": random.uniform(-5, 5),
+                },
+            }
+        )
+
+    return {
+        "items": notifications,
+        "meta": {
+            "page": page,
+            "pageSize": page_size,
+            "totalPages": 3,
+            "totalItems": 25,
+        },
+    }
+
+
+# Notifications are mock data, so pages for the common page sizes are
+# generated and serialized once at startup.
+NOTIFICATION_PAGES: Dict[Tuple[int, int], bytes] = {
+    (page, page_size): dump_json(build_notifications_page(page, page_size))
+    for page_size in (10, 20)
+    for page in range(1, 11)
+}
+
+
 # ---------------------------------------------------------------------------
 # Health
 # ---------------------------------------------------------------------------
 
 
 @app.get("/health/ping")
-def health_ping() -> Dict[str, str]:
+async def health_ping() -> Dict[str, str]:
     return {"status": "ok"}
 
 
@@ -147,11 +411,11 @@ def health_ping() -> Dict[str, str]:
 
 
 @app.post("/api/v2/mobile/auth/register")
-def register(payload: RegisterRequest) -> Dict[str, Any]:
+async def register(payload: RegisterRequest) -> PydanticResponse:
     if payload.email in MOCK_USERS:
         raise HTTPException(status_code=409, detail={"error": "conflict", "message": "Email already exists"})
 
-    user_id = f"user-{uuid.uuid4().hex[:8]}"
+    user_id = f"user-{secrets.token_hex(4)}"
     user = {
         "id": user_id,
         "firstName": payload.firstName,
@@ -160,42 +424,52 @@ def register(payload: RegisterRequest) -> Dict[str, Any]:
         "phone": payload.phone,
         "subscriptionTier": "free",
         "preferredLocations": [],
-        "createdAt": datetime.utcnow().isoformat() + "Z",
+        "createdAt": datetime.now(timezone.utc).strftime(ISO_UTC_FORMAT),
     }
     MOCK_USERS[payload.email] = user
 
     tokens = generate_tokens(user_id)
-    return {"user": user, "tokens": tokens}
+    return PydanticResponse(
+        AuthResponse.model_construct(
+            user=UserModel.model_construct(**user),
+            tokens=TokensResponse.model_construct(**tokens),
+        )
+    )
 
 
 @app.post("/api/v2/mobile/auth/login")
-def login(payload: LoginRequest) -> Dict[str, Any]:
+async def login(payload: LoginRequest) -> PydanticResponse:
     email = payload.email
     password = payload.password
 
     if email not in MOCK_USERS or password not in {"password123", "demo123"}:
         raise HTTPException(status_code=401, detail={"error": "unauthorized", "message": "Invalid credentials"})
 
-    user = MOCK_USERS[email].copy()
+    user = MOCK_USERS[email]
     tokens = generate_tokens(user["id"])
-    return {"user": user, "tokens": tokens}
+    return PydanticResponse(
+        AuthResponse.model_construct(
+            user=UserModel.model_construct(**user),
+            tokens=TokensResponse.model_construct(**tokens),
+        )
+    )
 
 
 @app.post("/api/v2/mobile/auth/refresh")
-def refresh_token(payload: RefreshRequest) -> Dict[str, Any]:
+async def refresh_token(payload: RefreshRequest) -> Dict[str, Any]:
     # In production, validate refresh token and derive user id
     user_id = "user-123"
     return generate_tokens(user_id)
 
 
 @app.post("/api/v2/mobile/auth/logout")
-def logout() -> Dict[str, Any]:
-    return {}
+async def logout() -> Response:
+    return Response(content=EMPTY_RESPONSE, media_type="application/json")
 
 
 @app.post("/api/v2/mobile/auth/verify-device")
-def verify_device() -> Dict[str, Any]:
-    return {}
+async def verify_device() -> Response:
+    return Response(content=EMPTY_RESPONSE, media_type="application/json")
 
 
 # ---------------------------------------------------------------------------
@@ -204,94 +478,35 @@ def verify_device() -> Dict[str, Any]:
 
 
 @app.get("/api/v2/mobile/properties/search")
-def search_properties(page: int = 1, pageSize: int = 20, query: Optional[str] = None) -> Dict[str, Any]:
-    page_size = min(pageSize, 50)
-    filtered = list(MOCK_PROPERTIES)
-
-    if query:
-        q = query.lower()
-        filtered = [
-            p
-            for p in filtered
-            if q in p["address"]["city"].lower() or q in p["title"].lower()
-        ]
+async def search_properties(
+    page: int = Query(1, ge=1),
+    pageSize: int = Query(20, ge=1, le=50),
+    query: Optional[str] = None,
+) -> Response:
+    if not query:
+        cached = SEARCH_PAGES.get((page, pageSize))
+        if cached is not None:
+            return Response(content=cached, media_type="application/json")
+        return FastORJSONResponse(content=paginate_properties(MOCK_PROPERTIES, page, pageSize))
 
-    start = (page - 1) * page_size
-    end = start + page_size
-    items = filtered[start:end]
+    q = query.lower()
+    filtered = list(compress(SEARCH_PROPERTIES, [q in key for key in SEARCH_KEYS]))
 
-    return {
-        "items": items,
-        "meta": {
-            "page": page,
-            "pageSize": page_size,
-            "totalPages": (len(filtered) // page_size) + 1,
-            "totalItems": len(filtered),
-        },
-    }
+    return FastORJSONResponse(content=paginate_properties(filtered, page, pageSize))
 
 
 @app.get("/api/v2/mobile/properties/{property_id}")
-def get_property(property_id: str) -> Dict[str, Any]:
-    prop = next((p for p in MOCK_PROPERTIES if p["id"] == property_id), None)
+async def get_property(property_id: str) -> Response:
+    prop = PROPERTY_BY_ID.get(property_id)
     if not prop:
         raise HTTPException(status_code=404, detail={"error": "not_found", "message": "Property not found"})
 
-    full_property = prop.copy()
-    full_property.update(
-        {
-            "description": f"{full_property['title']}. דירה מרווחת ומוארת ב{full_property['address']['city']}.",
-            "media": {
-                "images": [
-                    f"https://picsum.photos/600/400?random={property_id}-1",
-                    f"https://picsum.photos/600/400?random={property_id}-2",
-                    f"https://picsum.photos/600/400?random={property_id}-3",
-                ],
-                "videos": [],
-            },
-            "amenities": {
-                "mamad": random.choice([True, False]),
-                "elevator": random.choice([True, False]),
-                "parkingSpots": random.randint(0, 2),
-                "storage": random.choice([True, False]),
-                "balconySizeSqm": random.randint(0, 20),
-                "renovated": random.choice([True, False]),
-                "accessible": random.choice([True, False]),
-                "ac": random.choice([True, False]),
-            },
-            "prediction": {
-                "forecast12Months": int(full_property["price"] * 1.05),
-                "forecast24Months": int(full_property["price"] * 1.08),
-                "forecast60Months": int(full_property["price"] * 1.15),
-                "expectedIncreasePct": 5.0,
-                "annualRoiPct": 2.5,
-                "confidencePct": 80,
-            },
-            "neighborhood": {
-                "name": full_property["address"]["neighborhood"],
-                "avgPricePerSqm": full_property["price"] // full_property["sizeSqm"]
-                + random.randint(-5_000, 5_000),
-                "avgRqScore": random.randint(70, 85),
-                "propertiesCount": random.randint(50, 200),
-                "amenities": {
-                    "schools": random.randint(1, 5),
-                    "parks": random.randint(1, 3),
-                    "transitLines": random.randint(2, 8),
-                    "shoppingCenters": random.randint(1, 4),
-                },
-            },
-            "reasons": [
-                {"label": "מיקום מרכזי", "sentiment": "positive"},
-                {"label": "מחיר תחרותי", "sentiment": "positive"},
-            ],
-        }
-    )
-
-    return full_property
+    return Response(content=build_property_detail(property_id), media_type="application/json")
 
 
 @app.get("/api/v2/mobile/properties/saved")
-def get_saved_properties() -> Dict[str, Any]:
+async def get_saved_properties() -> FastORJSONResponse:
+    now = datetime.now(timezone.utc)
     saved: List[Dict[str, Any]] = []
     for prop in MOCK_PROPERTIES[:5]:
         saved.append(
@@ -299,20 +514,19 @@ def get_saved_properties() -> Dict[str, Any]:
                 "id": f"saved-{prop['id']}",
                 "property": prop,
                 "meta": {
-                    "savedAt": (datetime.utcnow() - timedelta(days=random.randint(1, 30))).isoformat()
-                    + "Z",
+                    "savedAt": (now - timedelta(days=random.randint(1, 30))).strftime(ISO_UTC_FORMAT),
                     "alertsEnabled": random.choice([True, False]),
                     "lastChange": random.choice([None, "המחיר ירד ב-2%", "סטטוס עודכן"]),
                     "daysSaved": random.randint(1, 30),
                 },
             }
         )
-    return {"items": saved}
+    return FastORJSONResponse(content={"items": saved})
 
 
 @app.post("/api/v2/mobile/properties/saved")
-def save_property(payload: SavePropertyRequest) -> Dict[str, Any]:
-    prop = next((p for p in MOCK_PROPERTIES if p["id"] == payload.propertyId), None)
+async def save_property(payload: SavePropertyRequest) -> Dict[str, Any]:
+    prop = PROPERTY_BY_ID.get(payload.propertyId)
     if not prop:
         raise HTTPException(status_code=404, detail={"error": "not_found", "message": "Property not found"})
 
@@ -320,7 +534,7 @@ def save_property(payload: SavePropertyRequest) -> Dict[str, Any]:
         "id": f"saved-{payload.propertyId}",
         "property": prop,
         "meta": {
-            "savedAt": datetime.utcnow().isoformat() + "Z",
+            "savedAt": datetime.now(timezone.utc).strftime(ISO_UTC_FORMAT),
             "alertsEnabled": payload.alertsEnabled,
             "lastChange": None,
             "daysSaved": 0,
@@ -329,8 +543,8 @@ def save_property(payload: SavePropertyRequest) -> Dict[str, Any]:
 
 
 @app.delete("/api/v2/mobile/properties/saved/{saved_id}")
-def delete_saved_property(saved_id: str) -> Dict[str, Any]:
-    return {}
+async def delete_saved_property(saved_id: str) -> Response:
+    return Response(content=EMPTY_RESPONSE, media_type="application/json")
 
 
 # ---------------------------------------------------------------------------
@@ -339,18 +553,14 @@ def delete_saved_property(saved_id: str) -> Dict[str, Any]:
 
 
 @app.get("/api/v2/mobile/user/profile")
-def get_profile() -> Dict[str, Any]:
+async def get_profile() -> Response:
     # In production, derive user from auth token
-    return MOCK_USERS["test@example.com"]
+    return Response(content=PROFILE_RESPONSE, media_type="application/json")
 
 
 @app.get("/api/v2/mobile/user/subscription")
-def get_subscription() -> Dict[str, Any]:
-    return {
-        "tier": "premium",
-        "expiresAt": (datetime.utcnow() + timedelta(days=30)).isoformat() + "Z",
-        "autoRenewing": True,
-    }
+async def get_subscription() -> Response:
+    return render_subscription(SUBSCRIPTION_TEMPLATE)
 
 
 # ---------------------------------------------------------------------------
@@ -359,43 +569,16 @@ def get_subscription() -> Dict[str, Any]:
 
 
 @app.get("/api/v2/mobile/notifications")
-def get_notifications(page: int = 1, pageSize: int = 10) -> Dict[str, Any]:
-    notifications: List[Dict[str, Any]] = []
-    for i in range(pageSize):
-        notifications.append(
-            {
-                "id": f"notif-{i}",
-                "type": random.choice(["new_property", "price_drop", "rq_change"]),
-                "title": "עדכון חדש",
-                "body": "המחיר של נכס שמור ירד ב-2%",
-                "createdAt": (datetime.utcnow() - timedelta(hours=i)).isoformat() + "Z",
-                "readAt": None,
-                "propertyId": f"property-{random.randint(1, 50)}",
-                "savedSearchId": None,
-                "metadata": {
-                    "thumbnailUrl": "https://picsum.photos/100/100?random=1",
-                    "city": "תל אביב",
-                    "rqScore": random.randint(60, 90),
-                    "price": random.randint(1_500_000, 4_000_000),
-                    "changePercent": random.uniform(-5, 5),
-                },
-            }
-        )
-
-    return {
-        "items": notifications,
-        "meta": {
-            "page": page,
-            "pageSize": pageSize,
-            "totalPages": 3,
-            "totalItems": 25,
-        },
-    }
+async def get_notifications(page: int = Query(1, ge=1), pageSize: int = Query(10, ge=1, le=50)) -> Response:
+    cached = NOTIFICATION_PAGES.get((page, pageSize))
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+    return FastORJSONResponse(content=build_notifications_page(page, pageSize))
 
 
 @app.put("/api/v2/mobile/notifications/{notification_id}/read")
-def mark_notification_read(notification_id: str) -> Dict[str, Any]:
-    return {}
+async def mark_notification_read(notification_id: str) -> Response:
+    return Response(content=EMPTY_RESPONSE, media_type="application/json")
 
 
 # ---------------------------------------------------------------------------
@@ -404,13 +587,5 @@ def mark_notification_read(notification_id: str) -> Dict[str, Any]:
 
 
 @app.post("/api/v2/mobile/billing/ios/verify")
-def verify_receipt(payload: ReceiptVerifyRequest) -> Dict[str, Any]:
-    return {
-        "success": True,
-        "subscription": {
-            "tier": "premium",
-            "expiresAt": (datetime.utcnow() + timedelta(days=30)).isoformat() + "Z",
-            "autoRenewing": True,
-        },
-        "message": "Subscription activated",
-    }
+async def verify_receipt(payload: ReceiptVerifyRequest) -> Response:
+    return render_subscription(RECEIPT_VERIFIED_TEMPLATE)